@@ -0,0 +1,37 @@
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import weather.cache
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(weather.cache, "CACHE_DIR", str(cache_dir))
+    monkeypatch.setattr(weather.cache, "_disk", None)
+    weather.cache._memory.clear()
+
+    yield cache_dir
+
+    if weather.cache._disk is not None:
+        weather.cache._disk.close()
+    weather.cache._memory.clear()
+
+
+@pytest.fixture
+def forecast() -> dict[str, Any]:
+    # A trimmed open-meteo response; 50.3 and 61.7 have no exact float32 representation
+    return {
+        "hourly": {"temperature_2m": [50.3, 61.7], "time": [1735689600, 1735693200]},
+        "hourly_units": {"temperature_2m": "°F", "time": "unixtime"},
+        "elevation": 35.0,
+        "latitude": 48.86,
+        "longitude": 2.35,
+        "timezone": "GMT",
+        "timezone_abbreviation": "GMT",
+        "utc_offset_seconds": 0,
+        "generationtime_ms": 0.1,
+    }
@@ -0,0 +1,24 @@
+from pathlib import Path
+
+import weather.cache
+from weather.cache import get_cached, set_cached
+
+
+def test_disk_cache_is_opened_on_first_use(isolated_cache: Path) -> None:
+    assert not isolated_cache.exists()
+
+    assert get_cached(("geocode", "paris, france")) is None
+    assert isolated_cache.exists()
+
+
+def test_cached_value_survives_memory_eviction(isolated_cache: Path) -> None:
+    set_cached(("geocode", "paris, france"), (48.8566, 2.3522), expire=60)
+    weather.cache._memory.clear()
+
+    assert get_cached(("geocode", "paris, france")) == (48.8566, 2.3522)
+
+
+def test_expired_value_is_not_returned(isolated_cache: Path) -> None:
+    set_cached(("geocode", "paris, france"), (48.8566, 2.3522), expire=-1)
+
+    assert get_cached(("geocode", "paris, france")) is None
@@ -0,0 +1,134 @@
+import asyncio
+import json
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+import httpx
+import pytest
+
+import weather.cache
+import weather.run
+from weather.cache import get_cached
+from weather.types import WeatherResult
+
+COORDINATES = {
+    "Paris, France": (48.8566, 2.3522),
+    "paris, france ": (48.8566, 2.3522),
+    "Paris": (48.8571, 2.3519),
+    "Lyon, France": (45.7640, 4.8357),
+}
+
+
+class _ForecastHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 keeps connections alive, so the client pools them between requests
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        self.server.requests.append(self.path)  # type: ignore[attr-defined]
+        body = json.dumps(self.server.forecast).encode()  # type: ignore[attr-defined]
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def forecast_server(forecast: dict[str, Any], monkeypatch: pytest.MonkeyPatch) -> Iterator[ThreadingHTTPServer]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ForecastHandler)
+    server.forecast = forecast  # type: ignore[attr-defined]
+    server.requests = []  # type: ignore[attr-defined]
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    monkeypatch.setattr(weather.run, "BASE_URL", f"http://127.0.0.1:{server.server_port}/v1/forecast")
+    monkeypatch.setattr(weather.run, "get_longitude_and_latitude_for_address", COORDINATES.__getitem__)
+    monkeypatch.setattr(weather.run, "get_cached", lambda key: None)
+    monkeypatch.setattr(weather.run, "set_cached", lambda key, value, expire: None)
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
+
+
+def test_run_weather_request_can_be_called_repeatedly(forecast_server: ThreadingHTTPServer) -> None:
+    # Each call runs on a fresh event loop; pooled connections must not leak between them
+    for _ in range(3):
+        result = weather.run.run_weather_request("Paris, France")
+        assert result.latitude == 48.86
+
+
+def _run_batch(addresses: list[str]) -> list[WeatherResult]:
+    async def run() -> list[WeatherResult]:
+        try:
+            return await weather.run.run_weather_requests_batch(addresses)
+        finally:
+            await weather.run.close_client()
+
+    return asyncio.run(run())
+
+
+def test_batch_can_run_on_successive_event_loops(forecast_server: ThreadingHTTPServer) -> None:
+    for _ in range(3):
+        results = _run_batch(["Paris, France", "Lyon, France"])
+        assert len(results) == 2
+
+    # Every loop's client was closed and forgotten
+    assert not weather.run._CLIENTS
+
+
+def test_batch_fetches_each_location_once(forecast_server: ThreadingHTTPServer) -> None:
+    addresses = ["Paris, France", "Lyon, France", "paris, france ", "Paris"]
+    results = _run_batch(addresses)
+
+    assert len(results) == len(addresses)
+    assert results[0] is results[2] is results[3]
+    # "Paris" geocodes to the same rounded grid point as "Paris, France"
+    assert len(forecast_server.requests) == 2  # type: ignore[attr-defined]
+
+
+def test_expired_forecast_is_revalidated_with_etag(forecast: dict[str, Any], monkeypatch: pytest.MonkeyPatch) -> None:
+    seen_etags: list[str | None] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_etags.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json=forecast, headers={"ETag": '"v1"'})
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(weather.run, "_get_client", lambda: client)
+
+    first = asyncio.run(weather.run._fetch_forecast(48.8566, 2.3522))
+    # Expire the fresh copy so the next request has to revalidate
+    weather.cache._memory.clear()
+    weather.cache._get_disk().delete(("forecast", 2, 48.86, 2.35))
+    second = asyncio.run(weather.run._fetch_forecast(48.8566, 2.3522))
+
+    assert seen_etags == [None, '"v1"']
+    assert second.latitude == first.latitude
+    # Only validators and raw bodies are stored, never a pickled model
+    assert isinstance(get_cached(("forecast", 2, 48.86, 2.35)), bytes)
+    validated = get_cached(("forecast-validators", 2, 48.86, 2.35))
+    assert validated is not None
+    etag, _, body = validated
+    assert etag == '"v1"' and isinstance(body, bytes)
+
+
+def test_batch_failure_leaves_no_running_fetches(forecast_server: ThreadingHTTPServer) -> None:
+    async def run() -> None:
+        try:
+            with pytest.raises(KeyError):
+                await weather.run.run_weather_requests_batch(["Paris, France", "Nowhere at all", "Lyon, France"])
+            # Sibling fetches were cancelled and awaited before the error surfaced
+            assert asyncio.all_tasks() == {asyncio.current_task()}
+        finally:
+            await weather.run.close_client()
+
+    asyncio.run(run())
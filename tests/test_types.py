@@ -0,0 +1,56 @@
+import pickle
+from typing import Any
+
+import numpy as np
+import pytest
+
+from weather.types import HourlyData, WeatherResult
+
+
+def test_temperatures_are_a_read_only_array(forecast: dict[str, Any]) -> None:
+    result = WeatherResult.model_validate(forecast)
+
+    assert isinstance(result.hourly.temperature_2m, np.ndarray)
+    with pytest.raises(ValueError):
+        result.hourly.temperature_2m[0] = 99
+
+
+def test_temperatures_stay_read_only_after_unpickling(forecast: dict[str, Any]) -> None:
+    result = pickle.loads(pickle.dumps(WeatherResult.model_validate(forecast)))
+
+    assert not result.hourly.temperature_2m.flags.writeable
+
+
+def test_unpickling_a_list_based_model_converts_it_to_an_array() -> None:
+    # Models pickled before temperatures became arrays stored a plain list
+    legacy = HourlyData.model_construct(temperature_2m=[1.0, 2.0], time=[])
+
+    restored = pickle.loads(pickle.dumps(legacy))
+
+    assert isinstance(restored.temperature_2m, np.ndarray)
+    assert not restored.temperature_2m.flags.writeable
+
+
+def test_null_temperature_is_rejected(forecast: dict[str, Any]) -> None:
+    forecast["hourly"]["temperature_2m"] = [None]
+
+    with pytest.raises(ValueError):
+        WeatherResult.model_validate(forecast)
+
+
+def test_separately_validated_results_compare_equal(forecast: dict[str, Any]) -> None:
+    assert WeatherResult.model_validate(forecast) == WeatherResult.model_validate(forecast)
+
+
+def test_temperatures_serialise_to_the_values_received(forecast: dict[str, Any]) -> None:
+    result = WeatherResult.model_validate(forecast)
+
+    assert result.model_dump()["hourly"]["temperature_2m"] == [50.3, 61.7]
+    assert '"temperature_2m":[50.3,61.7]' in result.model_dump_json()
+
+
+def test_result_round_trips_through_json(forecast: dict[str, Any]) -> None:
+    result = WeatherResult.model_validate(forecast)
+
+    assert WeatherResult.model_validate_json(result.model_dump_json()) == result
+    assert WeatherResult.model_json_schema()["$defs"]["HourlyData"]["properties"]["temperature_2m"]["type"] == "array"
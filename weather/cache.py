@@ -0,0 +1,58 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+from diskcache import Cache  # type: ignore[import-untyped]
+
+CACHE_DIR = os.path.expanduser("~/.cache/api_manager")
+MEMORY_CACHE_SIZE = 256
+
+# Two tiers: a small in-process LRU in front of a persistent disk cache
+_memory: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+_memory_lock = threading.Lock()
+# Opened on first use so importing the package never touches the filesystem
+_disk: Cache | None = None
+_disk_lock = threading.Lock()
+
+
+def _get_disk() -> Cache:
+    global _disk
+
+    with _disk_lock:
+        if _disk is None:
+            _disk = Cache(CACHE_DIR)
+        return _disk
+
+
+def _remember(key: Hashable, value: Any, expires_at: float) -> None:
+    with _memory_lock:
+        _memory[key] = (expires_at, value)
+        _memory.move_to_end(key)
+        if len(_memory) > MEMORY_CACHE_SIZE:
+            _memory.popitem(last=False)
+
+
+def get_cached(key: Hashable) -> Any | None:
+    with _memory_lock:
+        entry = _memory.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.time():
+                _memory.move_to_end(key)
+                return value
+            del _memory[key]
+
+    value, expires_at = _get_disk().get(key, expire_time=True)
+    if value is None:
+        return None
+
+    _remember(key, value, expires_at)
+    return value
+
+
+def set_cached(key: Hashable, value: Any, expire: float) -> None:
+    _get_disk().set(key, value, expire=expire)
+    _remember(key, value, time.time() + expire)
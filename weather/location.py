@@ -1,11 +1,33 @@
 from geopy import Nominatim
+from geopy.extra.rate_limiter import RateLimiter
+
+from weather.cache import get_cached, set_cached
+
+# Addresses don't move, so geocoding results can be kept for a long time
+GEOCODE_CACHE_SECONDS = 30 * 24 * 60 * 60
+
+# One geolocator for the whole process so its HTTP session (and pooled connections) is reused
+_GEOLOCATOR = Nominatim(user_agent="api_manager_location")
+# Nominatim's usage policy allows at most one request per second; failures are raised
+# straight away rather than retried after RateLimiter's default 5 second back-off
+_geocode = RateLimiter(_GEOLOCATOR.geocode, min_delay_seconds=1, max_retries=0, swallow_exceptions=False)
+
+
+def normalize_address(address: str) -> str:
+    return address.strip().lower()
 
 
 def get_longitude_and_latitude_for_address(address: str):
-    geolocator = Nominatim(user_agent="api_manager_location")
-    location = geolocator.geocode(query=address)
+    cache_key = ("geocode", normalize_address(address))
+    cached = get_cached(cache_key)
+    if cached is not None:
+        return cached
+
+    location = _geocode(query=address)
 
     if not location:
         raise Exception("Could not find coordinates for address")
 
-    return location.latitude, location.longitude
+    coordinates = location.latitude, location.longitude
+    set_cached(cache_key, coordinates, expire=GEOCODE_CACHE_SECONDS)
+    return coordinates
@@ -1,40 +1,188 @@
+import asyncio
+import io
+from collections.abc import Hashable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import partial
+from typing import Any
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
+from matplotlib.axes import Axes
+from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
+from numpy.typing import ArrayLike
 
-import requests
+import httpx
 
-from weather.location import get_longitude_and_latitude_for_address
+from weather.cache import get_cached, set_cached
+from weather.location import get_longitude_and_latitude_for_address, normalize_address
 from weather.types import WeatherResult
 
+BASE_URL = "https://api.open-meteo.com/v1/forecast"
+FORECAST_CACHE_SECONDS = 10 * 60
+REVALIDATE_CACHE_SECONDS = 24 * 60 * 60
+MAX_CONCURRENT_REQUESTS = 10
 
-def run_weather_request(address: str):
-    base_url = "https://api.open-meteo.com/v1/forecast"
+# One client per event loop so repeated requests reuse pooled (HTTP/2) connections;
+# pooled connections belong to the loop that opened them and can't be shared across loops.
+# Entries are only removed by close_client(), so async callers must call it before their loop ends.
+_CLIENTS: dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
 
-    lat, long = get_longitude_and_latitude_for_address(address=address)
-    params = {
+# Small dedicated pool for blocking work instead of the loop's default executor
+_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="api-mgr")
+
+# Reused across show_graph calls instead of building a new figure every time
+_FIGURE: Figure | None = None
+_AXES: Axes | None = None
+_LINE: Line2D | None = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    client = _CLIENTS.get(loop)
+    if client is None:
+        client = httpx.AsyncClient(http2=True, limits=httpx.Limits(max_keepalive_connections=20))
+        _CLIENTS[loop] = client
+    return client
+
+
+async def close_client() -> None:
+    """Close the HTTP client of the running event loop; call this before the loop shuts down."""
+    client = _CLIENTS.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+async def _get_cached(key: Hashable) -> Any | None:
+    # The disk tier does SQLite I/O, so keep cache access off the event loop too
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_EXECUTOR, get_cached, key)
+
+
+async def _set_cached(key: Hashable, value: Any, expire: float) -> None:
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(_EXECUTOR, partial(set_cached, key, value, expire=expire))
+
+
+async def _download_forecast(lat: float, long: float) -> bytes:
+    params: dict[str, str | float] = {
         "latitude": lat,
         "longitude": long,
         "hourly": "temperature_2m",
         "models": "gfs_seamless",
-        "temperature_unit": "fahrenheit"
+        "temperature_unit": "fahrenheit",
+        # Epoch seconds validate much faster than ISO 8601 strings
+        "timeformat": "unixtime",
     }
-    
-    response = requests.get(base_url, params=params)
+
+    # Once the fresh copy expires, ask the server whether the last response is still current
+    validator_key = ("forecast-validators", 2, lat, long)
+    validated = await _get_cached(validator_key)
+    headers: dict[str, str] = {}
+    if validated is not None:
+        etag, last_modified, _ = validated
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+    response = await _get_client().get(BASE_URL, params=params, headers=headers)
+
+    if response.status_code == httpx.codes.NOT_MODIFIED and validated is not None:
+        # Unchanged upstream: reuse the stored body instead of downloading it again
+        return validated[2]
 
     response.raise_for_status()
 
-    data = response.json()
-    return WeatherResult(**data)
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if etag or last_modified:
+        await _set_cached(validator_key, (etag, last_modified, response.content), expire=REVALIDATE_CACHE_SECONDS)
+
+    return response.content
+
+
+async def _fetch_forecast(lat: float, long: float) -> WeatherResult:
+    # Rounding to ~1 km keeps cache keys stable; the forecast grid is much coarser
+    lat, long = round(lat, 2), round(long, 2)
+
+    # Only raw response bodies are cached (never pickled models), so every hit is validated
+    # against the current WeatherResult schema. The "2" skips entries written by older versions.
+    cache_key = ("forecast", 2, lat, long)
+    body = await _get_cached(cache_key)
+    if body is None:
+        body = await _download_forecast(lat, long)
+        await _set_cached(cache_key, body, expire=FORECAST_CACHE_SECONDS)
+
+    # Validate straight from the raw bytes, skipping the intermediate dict
+    return WeatherResult.model_validate_json(body)
+
+
+async def _geocode(address: str) -> tuple[float, float]:
+    # Geocoding is blocking, so keep it off the event loop
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_EXECUTOR, get_longitude_and_latitude_for_address, address)
+
+
+async def run_weather_request_async(address: str) -> WeatherResult:
+    lat, long = await _geocode(address)
+    return await _fetch_forecast(lat, long)
+
 
+async def run_weather_requests_batch(addresses: list[str]) -> list[WeatherResult]:
+    request_slots = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    # Nominatim's usage policy allows at most one request at a time
+    geocode_slot = asyncio.Semaphore(1)
+    # Addresses that resolve to the same grid point share one forecast request
+    forecasts: dict[tuple[float, float], asyncio.Task[WeatherResult]] = {}
 
-def show_graph(times: list[datetime], temps: list[float], location: str):
-    fig, ax = plt.subplots(figsize=(8, 4.5))
+    async def fetch_forecast(lat: float, long: float) -> WeatherResult:
+        async with request_slots:
+            return await _fetch_forecast(lat, long)
 
-    # Plot with styling
-    ax.plot(
-        times,
-        temps,
+    # Look each distinct address up once, then map the results back to the input order
+    unique_addresses: dict[str, str] = {}
+    for address in addresses:
+        unique_addresses.setdefault(normalize_address(address), address)
+
+    try:
+        # A TaskGroup cancels and awaits every sibling task as soon as one address fails
+        async with asyncio.TaskGroup() as group:
+
+            async def fetch(address: str) -> WeatherResult:
+                async with geocode_slot:
+                    lat, long = await _geocode(address)
+                point = round(lat, 2), round(long, 2)
+                if point not in forecasts:
+                    forecasts[point] = group.create_task(fetch_forecast(*point))
+                return await forecasts[point]
+
+            tasks = [group.create_task(fetch(address)) for address in unique_addresses.values()]
+    except ExceptionGroup as errors:
+        # Surface the failure the same way run_weather_request_async would
+        raise errors.exceptions[0]
+
+    by_address = {key: task.result() for key, task in zip(unique_addresses, tasks)}
+    return [by_address[normalize_address(address)] for address in addresses]
+
+
+def run_weather_request(address: str) -> WeatherResult:
+    async def run() -> WeatherResult:
+        # asyncio.run closes its loop afterwards, so close that loop's client while it can still run
+        try:
+            return await run_weather_request_async(address)
+        finally:
+            await close_client()
+
+    return asyncio.run(run())
+
+
+def _style_plot(fig: Figure, ax: Axes) -> Line2D:
+    """Apply the graph styling to an empty axes and return its (still empty) temperature line."""
+    # Plot with styling; the data is filled in later
+    (line,) = ax.plot(
+        [],
+        [],
         marker="o",
         linestyle="-",
         linewidth=2,
@@ -42,8 +190,7 @@ def show_graph(times: list[datetime], temps: list[float], location: str):
         color="#1f77b4",
     )
 
-    # Title & labels
-    ax.set_title(f"Temperature for {location}", fontsize=14, pad=15)
+    # Labels
     ax.set_xlabel("Date / Time", fontsize=12, labelpad=10)
     ax.set_ylabel("Temperature (°F)", fontsize=12, labelpad=10)
 
@@ -55,5 +202,44 @@ def show_graph(times: list[datetime], temps: list[float], location: str):
     # Gentle grid
     ax.grid(True, linestyle="--", alpha=0.6)
 
-    plt.tight_layout()
-    plt.show()
\ No newline at end of file
+    return line
+
+
+def _draw(fig: Figure, ax: Axes, line: Line2D, times: list[datetime], temps: ArrayLike, location: str) -> None:
+    line.set_data(times, temps)
+    ax.relim()
+    ax.autoscale_view()
+
+    ax.set_title(f"Temperature for {location}", fontsize=14, pad=15)
+
+    fig.tight_layout()
+
+
+def _get_plot() -> tuple[Figure, Axes, Line2D]:
+    """Return the shared figure, creating and styling it the first time (or after its window was closed)."""
+    global _FIGURE, _AXES, _LINE
+
+    if _FIGURE is None or _AXES is None or _LINE is None or not plt.fignum_exists(_FIGURE.number):
+        _FIGURE, _AXES = plt.subplots(figsize=(8, 4.5))
+        _LINE = _style_plot(_FIGURE, _AXES)
+
+    return _FIGURE, _AXES, _LINE
+
+
+def show_graph(times: list[datetime], temps: ArrayLike, location: str):
+    fig, ax, line = _get_plot()
+    _draw(fig, ax, line, times, temps, location)
+    plt.show()
+
+
+def render_graph(times: list[datetime], temps: ArrayLike, location: str) -> bytes:
+    """Render the graph to PNG bytes without touching pyplot, so it is safe to call from a worker thread."""
+    # A standalone Figure always draws with Agg and never opens a window or blocks
+    fig = Figure(figsize=(8, 4.5))
+    ax = fig.subplots()
+    line = _style_plot(fig, ax)
+    _draw(fig, ax, line, times, temps, location)
+
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png")
+    return buffer.getvalue()
@@ -1,19 +1,64 @@
 from datetime import datetime
+from typing import Annotated, Any
 
-from pydantic import BaseModel, Field
+import numpy as np
+from numpy.typing import NDArray
+from pydantic import BaseModel, ConfigDict, Field, PlainSerializer, TypeAdapter, WithJsonSchema, field_validator
+
+_TEMPERATURES = TypeAdapter(list[float])
+
+
+def _to_temperature_array(value: object) -> NDArray[np.float64]:
+    # Validate as a list of floats (nulls and strings are still rejected), then store as an array
+    # so plotting and any aggregates can use it directly without converting a list each time.
+    # float64 keeps the exact values, so serialising gives back what the API sent.
+    if not isinstance(value, np.ndarray):
+        value = _TEMPERATURES.validate_python(value)
+    array = np.asarray(value, dtype=np.float64)
+    # Cached results are shared between callers, so the array must be as frozen as the model
+    array.setflags(write=False)
+    return array
 
 
 class HourlyData(BaseModel):
-    temperature_2m: list[float]
+    model_config = ConfigDict(frozen=True, extra="ignore", arbitrary_types_allowed=True)
+
+    # Serialised and described in JSON schema as a plain list of floats
+    temperature_2m: Annotated[
+        NDArray[np.float64],
+        PlainSerializer(lambda value: value.tolist(), return_type=list[float]),
+        WithJsonSchema(_TEMPERATURES.json_schema()),
+    ]
     time: list[datetime]
 
+    @field_validator("temperature_2m", mode="before")
+    @classmethod
+    def _to_array(cls, value: object) -> NDArray[np.float64]:
+        return _to_temperature_array(value)
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        # Unpickled state skips validation: it may hold a writable array, or a plain list
+        # if it was pickled by an older version of this model, so convert it again
+        super().__setstate__(state)
+        self.__dict__["temperature_2m"] = _to_temperature_array(self.__dict__["temperature_2m"])
+
+    def __eq__(self, other: object) -> bool:
+        # The default field-by-field comparison can't compare arrays element-wise
+        if not isinstance(other, HourlyData):
+            return NotImplemented
+        return self.time == other.time and np.array_equal(self.temperature_2m, other.temperature_2m)
+
 
 class HourlyUnits(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     temperature_2m: str
     time: str
 
 
 class WeatherResult(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     hourly: HourlyData
     hourly_units: HourlyUnits
 